@@ -1,23 +1,35 @@
+import threading
 import streamlit as st
 import yfinance as yf
 import pandas as pd
+from scheduler import RefreshScheduler
+from universe import UNIVERSE
+
+@st.cache_resource
+def get_quote_cache():
+    """Process-wide quote cache and refresh schedule, shared by every session."""
+    return {"scheduler": RefreshScheduler(UNIVERSE), "prices": {}, "lock": threading.Lock()}
 
 class AnalysisData:
     def __init__(self):
         """Initialize the stock data analysis module."""
-        self.stock_symbols = [
-            "RELIANCE.NS", "TCS.NS", "HDFCBANK.NS", "INFY.NS", "ICICIBANK.NS",
-            "HINDUNILVR.NS", "SBIN.NS", "BHARTIARTL.NS", "ITC.NS",
-            "LT.NS", "KOTAKBANK.NS", "AXISBANK.NS", "ASIANPAINT.NS", "BAJFINANCE.NS",
-            "MARUTI.NS", "ULTRACEMCO.NS", "TITAN.NS", "SUNPHARMA.NS", "TATASTEEL.NS",
-            "WIPRO.NS", "ONGC.NS", "COALINDIA.NS", "NTPC.NS", "POWERGRID.NS",
-            "INDUSINDBK.NS", "BAJAJFINSV.NS", "ADANIENT.NS", "GRASIM.NS", "JSWSTEEL.NS",
-            "HCLTECH.NS", "TECHM.NS", "NESTLEIND.NS", "CIPLA.NS", "BPCL.NS", "DRREDDY.NS",
-            "HDFCLIFE.NS", "BRITANNIA.NS", "DIVISLAB.NS", "SBILIFE.NS", "HEROMOTOCO.NS",
-            "BAJAJ-AUTO.NS", "TATAMOTORS.NS", "UPL.NS", "APOLLOHOSP.NS", "ADANIPORTS.NS",
-            "M&M.NS", "HINDALCO.NS", "TATACONSUM.NS", "AAPL", "MSFT", "GOOGL", "AMZN",
-            "TSLA", "META", "NVDA", "NFLX", "ADBE", "IBM"
-        ]
+        self.stock_symbols = UNIVERSE.yahoo_symbols(group="analysis")
+
+        # ✅ One refresh schedule and quote cache for all sessions, so reloads and new users don't refetch
+        cache = get_quote_cache()
+        self.scheduler = cache["scheduler"]
+        self.current_prices = cache["prices"]
+        self.lock = cache["lock"]
+
+    def refresh_prices(self, symbols):
+        """Fetch current prices for the given symbols into the shared quote cache (call under `self.lock`)."""
+        for symbol in symbols:
+            try:
+                data = yf.Ticker(symbol).history(period="1d")
+                self.current_prices[symbol] = data["Close"].iloc[-1] if not data.empty else None
+            except Exception as e:
+                print(f"Error fetching data for {symbol}: {e}")
+                self.current_prices[symbol] = None
 
     def display_analysis(self):
         """Displays stock data analysis on the Streamlit app."""
@@ -39,13 +51,16 @@ class AnalysisData:
 
         # Fetch and display current stock prices
         st.subheader("📊 Current Stock Prices")
-        current_prices = {
-            symbol: yf.Ticker(symbol).history(period="1d")["Close"].iloc[-1]
-            for symbol in self.stock_symbols
-        }
-        current_prices_df = pd.DataFrame(list(current_prices.items()), columns=['Symbol', 'Current Price'])
+        with self.lock:
+            # Only markets that are open or just closed are re-fetched
+            self.scheduler.run_pending("quotes", self.refresh_prices, group="analysis")
+            prices = [(symbol, self.current_prices.get(symbol)) for symbol in self.stock_symbols]
+        current_prices_df = pd.DataFrame(prices, columns=['Symbol', 'Current Price'])
         st.write(current_prices_df)
 
-        # Refresh button
+        # Refresh button: force a refetch of every symbol regardless of the market clock
         if st.button("🔄 Refresh Data"):
+            with self.lock:
+                self.refresh_prices(self.stock_symbols)
+                self.scheduler.mark_done("quotes", list(UNIVERSE.exchanges), group="analysis")
             st.rerun()
@@ -6,6 +6,7 @@ import requests
 from graph import StockGraphs
 from home import AIStockChatbot
 from analysis import AnalysisData  # ✅ Import Stock Analysis Class
+from risk_analytics import RiskDashboard
 
 # ✅ Ensure set_page_config is the FIRST Streamlit command
 st.set_page_config(page_title="AI Stock Market Dashboard", layout="wide")
@@ -74,10 +75,11 @@ df["Date"] = pd.to_datetime(df["Date"])
 # ✅ Create instances
 stock_graphs = StockGraphs(df)
 analysis_data = AnalysisData()  # ✅ Initialize Stock Analysis class
+risk_dashboard = RiskDashboard(file_path)
 
 # ✅ Sidebar with Dropdown Navigation
 st.sidebar.title("🌍 AI Trading Dashboard")
-page = st.sidebar.selectbox("🔍 Choose a Page:", ["Home", "Stock Analysis", "Stock Data"])
+page = st.sidebar.selectbox("🔍 Choose a Page:", ["Home", "Stock Analysis", "Stock Data", "Risk Heatmap"])
 
 # --- Home Page ---
 if page == "Home":
@@ -103,5 +105,9 @@ elif page == "Stock Analysis":
 elif page == "Stock Data":
     analysis_data.display_analysis()  # ✅ Call the Stock Data Analysis Method
 
+# --- Risk Heatmap Page ---
+elif page == "Risk Heatmap":
+    risk_dashboard.display_dashboard()
+
 # Set background (Ensure correct path to 'bg.jpeg')
 set_background_with_fade("bg.jpeg")
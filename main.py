@@ -4,6 +4,7 @@ import base64
 from graph import StockGraphs
 from home import AIStockChatbot
 from analysis import AnalysisData  # ✅ Import Stock Analysis Class
+from risk_analytics import RiskDashboard
 
 # ✅ Ensure set_page_config is the FIRST Streamlit command
 st.set_page_config(page_title="AI Stock Market Dashboard", layout="wide")
@@ -55,10 +56,11 @@ df["Date"] = pd.to_datetime(df["Date"])
 # ✅ Create instances
 stock_graphs = StockGraphs(df)
 analysis_data = AnalysisData()  # ✅ Initialize Stock Analysis class
+risk_dashboard = RiskDashboard(file_path)
 
 # ✅ Sidebar with Dropdown Navigation
 st.sidebar.title("🌍 AI Trading Dashboard")
-page = st.sidebar.selectbox("🔍 Choose a Page:", ["Home", "Stock Analysis", "Stock Data"])
+page = st.sidebar.selectbox("🔍 Choose a Page:", ["Home", "Stock Analysis", "Stock Data", "Risk Heatmap"])
 
 # --- Home Page ---
 if page == "Home":
@@ -81,3 +83,7 @@ elif page == "Stock Analysis":
 # --- Stock Data Page (Newly Added) ---
 elif page == "Stock Data":
     analysis_data.display_analysis()  # ✅ Call the Stock Data Analysis Method
+
+# --- Risk Heatmap Page ---
+elif page == "Risk Heatmap":
+    risk_dashboard.display_dashboard()
@@ -0,0 +1,274 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from universe import UNIVERSE
+
+TRADING_DAYS = 252
+
+
+class RollingRiskMatrix:
+    def __init__(self, symbols, window=60, rebase_every=None):
+        """Rolling window of daily returns with running sums for incremental covariance updates.
+
+        Each symbol's returns are taken on its own exchange's trading days only: a day
+        without a bar (holiday, weekend session elsewhere) is left out of that symbol's
+        sums rather than counted as a flat day, and every pair is measured over the days
+        both traded (pairwise-complete, like pandas `cov()`/`corr()`).
+        """
+        self.symbols = list(symbols)
+        self.window = window
+        # Running sums drift with float error; rebuild them from the buffer periodically
+        self.rebase_every = rebase_every or window
+        n = len(self.symbols)
+        self.returns = np.full((window, n), np.nan)  # Ring buffer of the last `window` return rows
+        self.dates = [None] * window
+        self.count = 0
+        self.head = 0  # Next slot to overwrite
+        # Pairwise running sums over rows where both symbols have a return:
+        # pairs[i, j] = count, sum[i, j] = sum of x_i, square[i, j] = sum of x_i**2, cross[i, j] = sum of x_i * x_j
+        self.pairs = np.zeros((n, n))
+        self.sum = np.zeros((n, n))
+        self.square = np.zeros((n, n))
+        self.cross = np.zeros((n, n))
+        self.updates_since_rebase = 0
+        self.last_date = None
+
+    def _accumulate(self, row, sign):
+        """Add (sign=1) or remove (sign=-1) one return row from the pairwise sums."""
+        present = ~np.isnan(row)
+        values = np.where(present, row, 0.0)
+        mask = present.astype(float)
+        self.pairs += sign * np.outer(mask, mask)
+        self.sum += sign * np.outer(values, mask)
+        self.square += sign * np.outer(values * values, mask)
+        self.cross += sign * np.outer(values, values)
+
+    def replace(self, slot, returns):
+        """Swap the return row stored in `slot` for a revised one, adjusting the running sums."""
+        row = np.asarray(returns, dtype=float)
+        self._accumulate(self.returns[slot], -1)
+        self._accumulate(row, 1)
+        self.returns[slot] = row
+
+    def update(self, date, returns):
+        """Push one bar of returns (NaN = symbol did not trade that day) and slide the window."""
+        row = np.asarray(returns, dtype=float)
+        if self.count == self.window:
+            self._accumulate(self.returns[self.head], -1)
+        else:
+            self.count += 1
+
+        self.returns[self.head] = row
+        self.dates[self.head] = date
+        self.head = (self.head + 1) % self.window
+        self._accumulate(row, 1)
+        self.last_date = date
+
+        self.updates_since_rebase += 1
+        if self.updates_since_rebase >= self.rebase_every:
+            self.rebase()
+
+    def rebase(self):
+        """Recompute the running sums exactly from the current window."""
+        rows = self.window_returns()
+        mask = (~np.isnan(rows)).astype(float)
+        values = np.nan_to_num(rows, nan=0.0)
+        self.pairs = mask.T @ mask
+        self.sum = values.T @ mask
+        self.square = (values * values).T @ mask
+        self.cross = values.T @ values
+        self.updates_since_rebase = 0
+
+    def window_returns(self):
+        """Return the rows currently in the window, oldest first."""
+        if self.count < self.window:
+            return self.returns[:self.count]
+        return np.roll(self.returns, -self.head, axis=0)
+
+    def _pairwise_variances(self):
+        """Sample variance of x_i over the days both i and j traded, as an N x N matrix."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var = (self.square - self.sum ** 2 / self.pairs) / (self.pairs - 1)
+        return np.where(self.pairs >= 2, np.clip(var, 0.0, None), np.nan)
+
+    def covariance(self):
+        """Pairwise-complete sample covariance matrix of daily returns over the window."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = (self.cross - self.sum * self.sum.T / self.pairs) / (self.pairs - 1)
+        return np.where(self.pairs >= 2, cov, np.nan)
+
+    def volatility(self, annualize=True):
+        """Per-symbol standard deviation of daily returns on its own trading days, annualized by default."""
+        vol = np.sqrt(np.diag(self._pairwise_variances()))
+        return vol * np.sqrt(TRADING_DAYS) if annualize else vol
+
+    def correlation(self):
+        """Pairwise-complete correlation matrix; pairs without variance or overlap are NaN."""
+        var = self._pairwise_variances()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = self.covariance() / np.sqrt(var * var.T)
+        corr[~np.isfinite(corr)] = np.nan
+        corr = np.clip(corr, -1.0, 1.0)
+        np.fill_diagonal(corr, np.where(np.diag(var) > 0, 1.0, np.nan))
+        return corr
+
+    def clusters(self, threshold=0.6):
+        """Cluster labels for the current correlation matrix (see `correlation_clusters`)."""
+        return correlation_clusters(self.correlation(), threshold)
+
+    @classmethod
+    def from_prices(cls, prices, window=60):
+        """Build the matrix from a Date x Symbol close-price frame."""
+        matrix = cls(prices.columns, window=window)
+        matrix.sync(prices)
+        return matrix
+
+    def sync(self, prices):
+        """Apply a Date x Symbol price frame: revise rows already in the window, append newer ones.
+
+        NSE closes before the US, so a date can first arrive with only some exchanges'
+        bars; when the rest land later the stored row is revised rather than skipped.
+        Returns the number of rows revised or appended.
+        """
+        # Return from each symbol's previous bar; NaN on days its exchange was closed
+        prices = prices[self.symbols]
+        returns = (prices / prices.ffill().shift(1) - 1).iloc[1:]
+        rows = returns.to_numpy()
+        slots = {date: slot for slot, date in enumerate(self.dates) if date is not None}
+        changed = 0
+        for date, row in zip(returns.index, rows):
+            if self.last_date is not None and date <= self.last_date:
+                slot = slots.get(date)
+                if slot is not None and not np.array_equal(self.returns[slot], row, equal_nan=True):
+                    self.replace(slot, row)
+                    changed += 1
+                continue
+            self.update(date, row)
+            changed += 1
+        return changed
+
+
+def correlation_clusters(corr, threshold=0.6):
+    """Group symbols whose correlation chains above `threshold` (connected components)."""
+    linked = np.nan_to_num(corr, nan=0.0) >= threshold
+    labels = np.full(len(corr), -1)
+    label = 0
+    for start in range(len(corr)):
+        if labels[start] >= 0:
+            continue
+        frontier = [start]
+        labels[start] = label
+        while frontier:
+            node = frontier.pop()
+            for neighbour in np.flatnonzero(linked[node] & (labels < 0)):
+                labels[neighbour] = label
+                frontier.append(neighbour)
+        label += 1
+    return labels
+
+
+def load_close_prices(file_path="stock.csv"):
+    """Pivot stock.csv into a Date x Symbol frame of closes aligned on the trading date."""
+    df = pd.read_csv(file_path, usecols=["Date", "Close", "Symbol"])
+    # NSE and US bars carry different UTC offsets; align them on the local trading date
+    df["Date"] = pd.to_datetime(df["Date"].str[:10])
+    return df.pivot_table(index="Date", columns="Symbol", values="Close").sort_index()
+
+
+@st.cache_data(max_entries=2)
+def load_cached_close_prices(file_path, mtime):
+    """Close-price frame cached per file modification time."""
+    return load_close_prices(file_path)
+
+
+@st.cache_resource(max_entries=4)
+def get_risk_matrix(file_path, window, symbols, _prices, _mtime):
+    """Risk matrix per file, window and symbol set, shared by all sessions.
+
+    The returned dict holds the matrix, the lock guarding it and the file mtime
+    it was last synced to; a new symbol set builds a fresh matrix.
+    """
+    return {
+        "matrix": RollingRiskMatrix.from_prices(_prices[list(symbols)], window=window),
+        "lock": threading.Lock(),
+        "mtime": _mtime,
+    }
+
+
+class RiskDashboard:
+    def __init__(self, file_path="stock.csv", window=20):
+        """Initialize the cross-asset risk dashboard over the given price file."""
+        self.file_path = file_path
+        self.window = window
+
+    def get_statistics(self):
+        """Sync the shared matrix with the price file and snapshot its statistics under its lock."""
+        mtime = os.path.getmtime(self.file_path)
+        prices = load_cached_close_prices(self.file_path, mtime)
+        cached = get_risk_matrix(self.file_path, self.window, tuple(prices.columns), prices, mtime)
+        with cached["lock"]:
+            matrix = cached["matrix"]
+            if cached["mtime"] != mtime:
+                matrix.sync(prices)
+                cached["mtime"] = mtime
+            return {
+                "symbols": np.array(matrix.symbols),
+                "count": matrix.count,
+                "last_date": matrix.last_date,
+                "corr": matrix.correlation(),
+                "vol": matrix.volatility(),
+            }
+
+    def display_dashboard(self):
+        """Render the correlation heatmap, volatilities and cluster view in Streamlit."""
+        st.markdown("<h1>🧮 Cross-Asset Risk Matrix</h1>", unsafe_allow_html=True)
+
+        try:
+            stats = self.get_statistics()
+        except FileNotFoundError:
+            st.error(f"Error: The price data file '{self.file_path}' was not found.")
+            return
+        if stats["count"] < 2:
+            st.error("❌ Not enough bars to compute risk statistics.")
+            return
+
+        symbols, corr, vol = stats["symbols"], stats["corr"], stats["vol"]
+        exchanges = np.array([
+            UNIVERSE.get(s).exchange.code if s in UNIVERSE else "Other" for s in symbols
+        ])
+
+        # ✅ Cluster symbols and order the heatmap so correlated blocks sit together
+        threshold = st.slider("Cluster correlation threshold", 0.0, 1.0, 0.6, 0.05)
+        labels = correlation_clusters(corr, threshold)
+        order = np.lexsort((symbols, labels))
+
+        st.caption(f"{len(symbols)} symbols · {stats['count']}-day window ending {stats['last_date']:%Y-%m-%d}")
+        fig = go.Figure(go.Heatmap(
+            z=corr[np.ix_(order, order)], x=symbols[order], y=symbols[order],
+            zmin=-1, zmax=1, colorscale="RdBu", reversescale=True,
+        ))
+        fig.update_layout(title="Correlation of Daily Returns", template="plotly_dark", height=800)
+        st.plotly_chart(fig, use_container_width=True)
+
+        # ✅ Per-symbol risk summary
+        st.subheader("📊 Annualized Volatility & Clusters")
+        summary = pd.DataFrame({
+            "Symbol": symbols, "Exchange": exchanges, "Cluster": labels, "Volatility": vol,
+        }).sort_values("Volatility", ascending=False)
+        st.dataframe(summary, use_container_width=True)
+
+        # ✅ Average cross-correlation between exchanges
+        st.subheader("🌐 Average Correlation by Exchange")
+        codes = np.unique(exchanges)
+        pairwise = corr.copy()
+        np.fill_diagonal(pairwise, np.nan)  # Exclude self-correlation
+        block = pd.DataFrame(
+            [[np.nanmean(pairwise[np.ix_(exchanges == a, exchanges == b)]) for b in codes] for a in codes],
+            index=codes, columns=codes,
+        )
+        st.dataframe(block.style.format("{:.2f}"))
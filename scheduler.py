@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+
+from universe import UNIVERSE
+
+# ✅ Refresh cadence per exchange and upstream task while the market is open
+DEFAULT_CADENCES = {
+    "NSE": {"quotes": timedelta(minutes=1)},
+    "NASDAQ": {"quotes": timedelta(minutes=1)},
+    "NYSE": {"quotes": timedelta(minutes=1)},
+}
+
+
+class RefreshScheduler:
+    def __init__(self, registry=UNIVERSE, cadences=None, grace_period=timedelta(minutes=30)):
+        """Schedule upstream fetches only for exchanges that are open or just closed."""
+        self.registry = registry
+        self.cadences = cadences or DEFAULT_CADENCES
+        self.grace_period = grace_period
+        self.last_run = {}  # (exchange code, task, group) -> last refresh time
+
+    def is_active(self, exchange, now):
+        """An exchange is active while open and for `grace_period` after its session close."""
+        if exchange.is_open(now):
+            return True
+        last_close = exchange.last_close(now)
+        return last_close is not None and now - last_close <= self.grace_period
+
+    def is_due(self, exchange, task, now, group=None):
+        """Check whether `task` should run for `exchange` (and symbol group) at `now`."""
+        last = self.last_run.get((exchange.code, task, group))
+        if last is None:
+            return True  # Cold start: always load once so dashboards have data
+        if self.is_active(exchange, now):
+            return now - last >= self.cadences[exchange.code][task]
+        # Closed: one final refresh after the close to capture settled prices, then idle
+        last_close = exchange.last_close(now)
+        return last_close is not None and last < last_close
+
+    def due_exchanges(self, task, group=None, now=None):
+        """Return the codes of exchanges whose `task` refresh is due."""
+        now = now or datetime.now(timezone.utc)
+        return [code for code, exchange in self.registry.exchanges.items() if self.is_due(exchange, task, now, group)]
+
+    def mark_done(self, task, exchanges, group=None, now=None):
+        """Record a completed refresh of `task` for the given exchange codes."""
+        now = now or datetime.now(timezone.utc)
+        for code in exchanges:
+            self.last_run[(code, task, group)] = now
+
+    def run_pending(self, task, refresh, group=None, now=None):
+        """Call `refresh(symbols)` for the due symbols of `task` and return the refreshed symbols."""
+        now = now or datetime.now(timezone.utc)
+        exchanges = self.due_exchanges(task, group, now)
+        symbols = self.registry.yahoo_symbols(group, exchanges) if exchanges else []
+        if symbols:
+            refresh(symbols)
+        self.mark_done(task, exchanges, group, now)
+        return symbols
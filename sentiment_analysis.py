@@ -5,6 +5,7 @@ import yfinance as yf
 import streamlit as st
 import nltk  
 from nltk.sentiment.vader import SentimentIntensityAnalyzer  
+from universe import UNIVERSE
 
 # ✅ Download VADER lexicon if not available
 nltk.download('vader_lexicon')
@@ -14,9 +15,7 @@ class SentimentAnalyzer:
         """Initialize the Sentiment Analyzer with a tweet dataset."""
         self.tweet_file = tweet_file
         self.sent_df = None
-        self.stock_symbols = ["TSLA", "MSFT", "PG", "META", "AMZN", "GOOG", "AAPL", "AMD", "NFLX",
-                              "TSM", "KOF", "PYPL", "NOC", "BX", "BA", "INTC", "CRM", "NU", "DTS",
-                              "COST", "ENPH", "NIO", "ZS", "XPEV"]
+        self.stock_symbols = UNIVERSE.yahoo_symbols(group="sentiment")
         self.current_prices = {}
         self.combined_df = None  # Store final data
 
@@ -44,15 +43,16 @@ class SentimentAnalyzer:
         self.sent_df["Neutral"] = 0.0
         self.sent_df["Positive"] = 0.0
 
-    def analyze_sentiment(self):
-        """Perform sentiment analysis on tweets."""
+    def analyze_sentiment(self, symbols=None):
+        """Perform sentiment analysis on tweets (only those of `symbols` if given)."""
         if self.sent_df is None:
             st.error("Tweet dataset not loaded.")
             return
 
         sia = SentimentIntensityAnalyzer()
+        tweets = self.sent_df if symbols is None else self.sent_df[self.sent_df["Stock Symbol"].isin(symbols)]
 
-        for index, row in self.sent_df.iterrows():
+        for index, row in tweets.iterrows():
             try:
                 sentence_i = unicodedata.normalize('NFKD', row['Tweet'])
                 sentence_sentiment = sia.polarity_scores(sentence_i)
@@ -64,9 +64,9 @@ class SentimentAnalyzer:
                 print(f"Error processing tweet at index {index}")
                 break
 
-    def fetch_stock_prices(self):
-        """Fetch current stock prices from Yahoo Finance."""
-        for symbol in self.stock_symbols:
+    def fetch_stock_prices(self, symbols=None):
+        """Fetch current stock prices from Yahoo Finance (all sentiment symbols by default)."""
+        for symbol in symbols if symbols is not None else self.stock_symbols:
             try:
                 stock = yf.Ticker(symbol)
                 data = stock.history(period="1d")
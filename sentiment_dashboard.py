@@ -1,54 +1,153 @@
-import streamlit as st
+import math
+
+import numpy as np
 import pandas as pd
+import streamlit as st
+
+DECISION_BUY = "BUY ✅"
+DECISION_SELL = "SELL ❌"
+DECISION_HOLD = "HOLD ⏸️"
+
+DECISION_COLORS = {
+    DECISION_BUY: "background-color: lightgreen",
+    DECISION_SELL: "background-color: salmon",
+    DECISION_HOLD: "background-color: #ADD8E6",  # Light Blue for HOLD
+}
+
 
 class SentimentDashboard:
-    def __init__(self, csv_file="combined_stock_data.csv"):
-        """Initialize the sentiment dashboard with the given dataset."""
+    def __init__(self, csv_file="combined_stock_data.csv", buy_threshold=0.2, sell_threshold=-0.2,
+                 page_size=25, max_listed_symbols=20):
+        """Initialize the sentiment dashboard with the given dataset and decision thresholds."""
+        if sell_threshold > buy_threshold:
+            raise ValueError("sell_threshold must not be greater than buy_threshold")
         self.csv_file = csv_file
+        self.buy_threshold = buy_threshold
+        self.sell_threshold = sell_threshold
+        self.page_size = page_size
+        self.max_listed_symbols = max_listed_symbols
         self.df = None  # Placeholder for the dataframe
+        self.summary = None  # Per-decision aggregates, computed once in load_data
+
+    def compute_decisions(self, scores):
+        """Map sentiment scores to Buy/Sell/Hold decisions in a single vectorized pass."""
+        scores = np.asarray(scores, dtype=float)
+        return np.select(
+            [scores > self.buy_threshold, scores < self.sell_threshold],
+            [DECISION_BUY, DECISION_SELL],
+            default=DECISION_HOLD,
+        )
 
     def load_data(self):
-        """Load the sentiment data and process decisions."""
+        """Load the sentiment data, process decisions and precompute per-decision aggregates."""
         try:
             self.df = pd.read_csv(self.csv_file)
+        except FileNotFoundError:
+            st.error(f"Error: The sentiment data file '{self.csv_file}' was not found. Please run sentiment analysis first.")
+            return
 
-            # ✅ Decision Logic (Buy/Sell/Hold)
-            def get_decision(sentiment_score):
-                if sentiment_score > 0.2:
-                    return "BUY ✅"
-                elif sentiment_score < -0.2:
-                    return "SELL ❌"
-                else:
-                    return "HOLD ⏸️"
+        # ✅ Vectorized Decision Logic (Buy/Sell/Hold)
+        self.df["Decision"] = pd.Categorical(
+            self.compute_decisions(self.df["sentiment_score"].to_numpy()),
+            categories=[DECISION_BUY, DECISION_SELL, DECISION_HOLD],
+        )
+        self.summary = self.compute_summary(self.df)
 
-            # ✅ Apply Decision
-            self.df["Decision"] = self.df["sentiment_score"].apply(get_decision)
+    def compute_summary(self, df):
+        """Precompute counts, mean sentiment and symbol lists for each decision."""
+        grouped = df.groupby("Decision", observed=False)
+        counts = grouped.size()
+        mean_scores = grouped["sentiment_score"].mean()
+        symbols = grouped["Stock Symbol"].agg(list)
+        return {
+            decision: {
+                "count": int(counts.get(decision, 0)),
+                "mean_score": mean_scores.get(decision, float("nan")),
+                "symbols": symbols.get(decision, []),
+            }
+            for decision in df["Decision"].cat.categories
+        }
 
-        except FileNotFoundError:
-            st.error(f"Error: The sentiment data file '{self.csv_file}' was not found. Please run sentiment analysis first.")
+    def filter_rows(self, decision=None, search=None):
+        """Return the rows matching a decision and/or symbol search."""
+        mask = np.ones(len(self.df), dtype=bool)
+        if decision:
+            mask &= (self.df["Decision"] == decision).to_numpy()
+        if search:
+            mask &= self.df["Stock Symbol"].str.contains(search, case=False, regex=False, na=False).to_numpy()
+        return self.df[mask]
+
+    def paginate(self, df, sort_by="sentiment_score", ascending=False, page=1, page_size=None):
+        """Sort and slice a frame down to a single page."""
+        page_size = page_size or self.page_size
+        start = (max(page, 1) - 1) * page_size
+        stop = start + page_size
+        if sort_by not in df.columns:
+            return df.iloc[start:stop]
+
+        # ✅ Partial sort: only the rows up to the requested page need ordering
+        if stop < len(df) and pd.api.types.is_numeric_dtype(df[sort_by]):
+            top = df.nsmallest(stop, sort_by) if ascending else df.nlargest(stop, sort_by)
+            return top.iloc[start:stop]
+        return df.sort_values(sort_by, ascending=ascending, kind="stable").iloc[start:stop]
+
+    def query(self, decision=None, search=None, sort_by="sentiment_score", ascending=False, page=1, page_size=None):
+        """Filter, sort and paginate the recommendations, returning (page_df, total_rows)."""
+        filtered = self.filter_rows(decision, search)
+        return self.paginate(filtered, sort_by, ascending, page, page_size), len(filtered)
+
+    def style_page(self, page_df):
+        """Apply decision color coding to the visible page only."""
+        return page_df.style.apply(
+            lambda col: col.astype(str).map(DECISION_COLORS).fillna(""),
+            subset=["Decision"],
+        )
+
+    def format_symbols(self, symbols):
+        """Join a symbol list for display, truncating long lists."""
+        shown = ", ".join(symbols[:self.max_listed_symbols])
+        remaining = len(symbols) - self.max_listed_symbols
+        return f"{shown} … and {remaining} more" if remaining > 0 else shown
 
     def display_dashboard(self):
         """Render the sentiment analysis results in Streamlit."""
         if self.df is None:
             st.error("❌ No data available for sentiment analysis.")
             return
-        
+
         st.markdown("<h1>📊 AI-Powered Stock Sentiment Analyzer</h1>", unsafe_allow_html=True)
 
-        # ✅ Display Data with Color Coding
+        # ✅ Decision Summary (precomputed aggregates)
+        columns = st.columns(len(self.summary))
+        for column, (decision, stats) in zip(columns, self.summary.items()):
+            column.metric(decision, stats["count"],
+                          f"avg {stats['mean_score']:.3f}" if stats["count"] else None,
+                          delta_color="off")
+
+        # ✅ Server-side filtering, sorting and pagination
         st.subheader("📑 Sentiment-Based Stock Recommendations")
-        st.dataframe(self.df.style.applymap(
-            lambda x: "background-color: lightgreen" if x == "BUY ✅" else 
-                      "background-color: salmon" if x == "SELL ❌" else 
-                      "background-color: #ADD8E6" if x == "HOLD ⏸️" else "",  # Light Blue for HOLD
-            subset=["Decision"]
-        ))
+        filter_col, search_col, sort_col, order_col = st.columns(4)
+        decision = filter_col.selectbox("Decision", ["All"] + list(self.summary.keys()))
+        search = search_col.text_input("🔍 Search Symbol")
+        sort_by = sort_col.selectbox("Sort by", list(self.df.columns),
+                                     index=list(self.df.columns).index("sentiment_score"))
+        ascending = order_col.radio("Order", ["Descending", "Ascending"], horizontal=True) == "Ascending"
+
+        decision = None if decision == "All" else decision
+        filtered = self.filter_rows(decision, search)
+        total = len(filtered)
+        page_count = max(math.ceil(total / self.page_size), 1)
+        page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1, step=1)
+
+        page_df = self.paginate(filtered, sort_by, ascending, int(page))
+        st.dataframe(self.style_page(page_df))
+        st.caption(f"Showing {len(page_df)} of {total} stocks")
 
         # ✅ Investment Summary
-        buy_stocks = self.df[self.df["Decision"] == "BUY ✅"]
-        sell_stocks = self.df[self.df["Decision"] == "SELL ❌"]
+        buy_symbols = self.summary[DECISION_BUY]["symbols"]
+        sell_symbols = self.summary[DECISION_SELL]["symbols"]
 
         st.markdown("### 📌 Investment Recommendations:")
-        st.success(f"💰 **Stocks to BUY:** {', '.join(buy_stocks['Stock Symbol'].tolist())}" if not buy_stocks.empty else "No stocks recommended for buying.")
-        st.error(f"🚨 **Stocks to SELL:** {', '.join(sell_stocks['Stock Symbol'].tolist())}" if not sell_stocks.empty else "No stocks recommended for selling.")
+        st.success(f"💰 **Stocks to BUY:** {self.format_symbols(buy_symbols)}" if buy_symbols else "No stocks recommended for buying.")
+        st.error(f"🚨 **Stocks to SELL:** {self.format_symbols(sell_symbols)}" if sell_symbols else "No stocks recommended for selling.")
         st.info("⏳ **Stocks to HOLD:** Market sentiment is neutral for remaining stocks.")
@@ -0,0 +1,196 @@
+import logging
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+
+class Exchange:
+    def __init__(self, code, timezone, open_time, close_time, suffix="", holidays=()):
+        """Describe an exchange: its timezone, regular session hours, ticker suffix and holidays."""
+        self.code = code
+        self.timezone = ZoneInfo(timezone)
+        self.open_time = open_time
+        self.close_time = close_time
+        self.suffix = suffix
+        self.holidays = frozenset(holidays)
+        # Last year the holiday calendar covers; later holidays would be treated as trading days
+        self.calendar_end = max((day.year for day in self.holidays), default=None)
+        self._warned_years = set()
+
+    def local_now(self, now=None):
+        """Return `now` (default: current time) converted to the exchange timezone."""
+        now = now or datetime.now(self.timezone)
+        if now.tzinfo is None:
+            raise ValueError("now must be timezone-aware")
+        return now.astimezone(self.timezone)
+
+    def is_trading_day(self, day):
+        """Check whether the given local date is a weekday and not an exchange holiday."""
+        if self.calendar_end is not None and day.year > self.calendar_end and day.year not in self._warned_years:
+            self._warned_years.add(day.year)
+            logger.warning("%s holiday calendar ends in %d; treating all weekdays in %d as trading days",
+                           self.code, self.calendar_end, day.year)
+        return day.weekday() < 5 and day not in self.holidays
+
+    def is_open(self, now=None):
+        """Check whether the regular session is open at `now`."""
+        local = self.local_now(now)
+        return self.is_trading_day(local.date()) and self.open_time <= local.time() < self.close_time
+
+    def last_close(self, now=None):
+        """Return the most recent session close at or before `now`, or None if none in the past two weeks."""
+        local = self.local_now(now)
+        for offset in range(15):
+            day = local.date() - timedelta(days=offset)
+            if not self.is_trading_day(day):
+                continue
+            close = datetime.combine(day, self.close_time, tzinfo=self.timezone)
+            if close <= local:
+                return close
+        return None
+
+    def __repr__(self):
+        return f"Exchange({self.code!r})"
+
+
+class StockSymbol:
+    def __init__(self, ticker, exchange, groups=()):
+        """A listed symbol: the bare ticker, its exchange and the universe groups it belongs to."""
+        self.ticker = ticker
+        self.exchange = exchange
+        self.groups = frozenset(groups)
+
+    @property
+    def yahoo_symbol(self):
+        """Ticker as used by Yahoo Finance, e.g. 'RELIANCE.NS' for NSE listings."""
+        return f"{self.ticker}{self.exchange.suffix}"
+
+    def __repr__(self):
+        return f"StockSymbol({self.yahoo_symbol!r})"
+
+
+class UniverseRegistry:
+    def __init__(self):
+        """Central registry of exchanges and symbols, preserving registration order."""
+        self.exchanges = {}
+        self._symbols = {}
+        self._groups = {}  # group -> Yahoo tickers in declared order
+
+    def add_exchange(self, exchange):
+        """Register an exchange."""
+        self.exchanges[exchange.code] = exchange
+        return exchange
+
+    def add(self, ticker, exchange_code, groups=()):
+        """Register a symbol (bare or Yahoo-suffixed ticker); re-adding merges its groups."""
+        exchange = self.exchanges[exchange_code]
+        ticker = self.strip_suffix(ticker, exchange)
+        key = f"{ticker}{exchange.suffix}"
+        for group in groups:
+            members = self._groups.setdefault(group, [])
+            if key not in members:
+                members.append(key)
+        if key in self._symbols:
+            existing = self._symbols[key]
+            existing.groups = existing.groups | frozenset(groups)
+            return existing
+        self._symbols[key] = StockSymbol(ticker, exchange, groups)
+        return self._symbols[key]
+
+    def strip_suffix(self, ticker, exchange):
+        """Remove the exchange suffix (e.g. '.NS') from a ticker if present."""
+        if exchange.suffix and ticker.endswith(exchange.suffix):
+            return ticker[:-len(exchange.suffix)]
+        return ticker
+
+    def get(self, symbol):
+        """Look up a symbol by its Yahoo ticker, e.g. 'TCS.NS' or 'AAPL'."""
+        try:
+            return self._symbols[symbol]
+        except KeyError:
+            raise KeyError(f"Unknown symbol: {symbol}") from None
+
+    def __contains__(self, symbol):
+        return symbol in self._symbols
+
+    def __len__(self):
+        return len(self._symbols)
+
+    def symbols(self, group=None, exchanges=None):
+        """Return registered symbols, optionally filtered by group and/or exchange codes.
+
+        Symbols of a group come back in the order the group declared them.
+        """
+        if group is None:
+            candidates = self._symbols.values()
+        else:
+            candidates = [self._symbols[key] for key in self._groups.get(group, [])]
+        return [s for s in candidates if exchanges is None or s.exchange.code in exchanges]
+
+    def yahoo_symbols(self, group=None, exchanges=None):
+        """Return Yahoo tickers for the matching symbols."""
+        return [s.yahoo_symbol for s in self.symbols(group, exchanges)]
+
+
+# ✅ Trading calendars (regular-session full-day holidays)
+NSE_HOLIDAYS_2025 = [
+    date(2025, 2, 26), date(2025, 3, 14), date(2025, 3, 31), date(2025, 4, 10),
+    date(2025, 4, 14), date(2025, 4, 18), date(2025, 5, 1), date(2025, 8, 15),
+    date(2025, 8, 27), date(2025, 10, 2), date(2025, 10, 21), date(2025, 10, 22),
+    date(2025, 11, 5), date(2025, 12, 25),
+]
+NSE_HOLIDAYS_2026 = [
+    date(2026, 1, 15), date(2026, 1, 26), date(2026, 3, 3), date(2026, 3, 26),
+    date(2026, 3, 31), date(2026, 4, 3), date(2026, 4, 14), date(2026, 5, 1),
+    date(2026, 5, 28), date(2026, 6, 26), date(2026, 9, 14), date(2026, 10, 2),
+    date(2026, 10, 20), date(2026, 11, 10), date(2026, 11, 24), date(2026, 12, 25),
+]
+US_HOLIDAYS_2025 = [
+    date(2025, 1, 1), date(2025, 1, 9), date(2025, 1, 20), date(2025, 2, 17),
+    date(2025, 4, 18), date(2025, 5, 26), date(2025, 6, 19), date(2025, 7, 4),
+    date(2025, 9, 1), date(2025, 11, 27), date(2025, 12, 25),
+]
+US_HOLIDAYS_2026 = [
+    date(2026, 1, 1), date(2026, 1, 19), date(2026, 2, 16), date(2026, 4, 3),
+    date(2026, 5, 25), date(2026, 6, 19), date(2026, 7, 3), date(2026, 9, 7),
+    date(2026, 11, 26), date(2026, 12, 25),
+]
+NSE_HOLIDAYS = NSE_HOLIDAYS_2025 + NSE_HOLIDAYS_2026
+US_HOLIDAYS = US_HOLIDAYS_2025 + US_HOLIDAYS_2026
+
+NSE_SYMBOLS = [
+    "RELIANCE", "TCS", "HDFCBANK", "INFY", "ICICIBANK",
+    "HINDUNILVR", "SBIN", "BHARTIARTL", "ITC",
+    "LT", "KOTAKBANK", "AXISBANK", "ASIANPAINT", "BAJFINANCE",
+    "MARUTI", "ULTRACEMCO", "TITAN", "SUNPHARMA", "TATASTEEL",
+    "WIPRO", "ONGC", "COALINDIA", "NTPC", "POWERGRID",
+    "INDUSINDBK", "BAJAJFINSV", "ADANIENT", "GRASIM", "JSWSTEEL",
+    "HCLTECH", "TECHM", "NESTLEIND", "CIPLA", "BPCL", "DRREDDY",
+    "HDFCLIFE", "BRITANNIA", "DIVISLAB", "SBILIFE", "HEROMOTOCO",
+    "BAJAJ-AUTO", "TATAMOTORS", "UPL", "APOLLOHOSP", "ADANIPORTS",
+    "M&M", "HINDALCO", "TATACONSUM",
+]
+US_ANALYSIS_SYMBOLS = ["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "META", "NVDA", "NFLX", "ADBE", "IBM"]
+US_SENTIMENT_SYMBOLS = ["TSLA", "MSFT", "PG", "META", "AMZN", "GOOG", "AAPL", "AMD", "NFLX",
+                        "TSM", "KOF", "PYPL", "NOC", "BX", "BA", "INTC", "CRM", "NU", "DTS",
+                        "COST", "ENPH", "NIO", "ZS", "XPEV"]
+NYSE_LISTED = {"PG", "TSM", "KOF", "NOC", "BX", "BA", "CRM", "NU", "NIO", "XPEV", "IBM"}
+
+
+def build_default_universe():
+    """Build the registry for the NSE/US book used by the dashboards."""
+    registry = UniverseRegistry()
+    registry.add_exchange(Exchange("NSE", "Asia/Kolkata", time(9, 15), time(15, 30), ".NS", NSE_HOLIDAYS))
+    registry.add_exchange(Exchange("NASDAQ", "America/New_York", time(9, 30), time(16, 0), "", US_HOLIDAYS))
+    registry.add_exchange(Exchange("NYSE", "America/New_York", time(9, 30), time(16, 0), "", US_HOLIDAYS))
+
+    for ticker in NSE_SYMBOLS:
+        registry.add(ticker, "NSE", groups=["analysis"])
+    for group, tickers in (("analysis", US_ANALYSIS_SYMBOLS), ("sentiment", US_SENTIMENT_SYMBOLS)):
+        for ticker in tickers:
+            registry.add(ticker, "NYSE" if ticker in NYSE_LISTED else "NASDAQ", groups=[group])
+    return registry
+
+
+UNIVERSE = build_default_universe()